@@ -1,9 +1,95 @@
+import io
+
+import numpy as np
 import pandas as pd
 import streamlit as st
-from matplotlib import colormaps
 
+from soiltextureplot import (
+    PolygonClassifier,
+    get_texture_system,
+    plot_triangle_with_points,
+)
 from soiltextureplot.systems import list_texture_systems
-from soiltextureplot.triangle import SoilTextureTriangle
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    HAVE_PYARROW = True
+except ImportError:  # pandas' parser is used when pyarrow is unavailable
+    HAVE_PYARROW = False
+
+
+@st.cache_resource
+def get_classifier(system_name: str) -> PolygonClassifier:
+    """Build the classifier for a texture system once and share it across reruns."""
+    return PolygonClassifier.from_system(get_texture_system(system_name))
+
+
+@st.cache_data
+def load_csv(data: bytes) -> pd.DataFrame:
+    """Parse uploaded CSV bytes; cached on the content, not the upload widget."""
+    if HAVE_PYARROW:
+        # Arrow's multi-threaded parser is much faster on large uploads.
+        read_options = pa_csv.ReadOptions(use_threads=True, block_size=2 << 20)
+        try:
+            return pa_csv.read_csv(
+                io.BytesIO(data), read_options=read_options
+            ).to_pandas()
+        except pa.ArrowInvalid:
+            pass  # let pandas handle (or report) files Arrow is stricter about
+    return pd.read_csv(io.BytesIO(data))
+
+
+@st.cache_data
+def classify_df(
+    data: bytes, system_name: str, sand_col: str, silt_col: str, clay_col: str
+) -> pd.DataFrame:
+    """Classify the uploaded samples; plot-only widget changes reuse the result."""
+    classified = load_csv(data).rename(
+        columns={sand_col: "sand", silt_col: "silt", clay_col: "clay"}
+    )
+    # One packed (clay, sand, silt) extraction in the classifier's dtype.
+    points = classified[["clay", "sand", "silt"]].to_numpy(
+        dtype=np.float32, na_value=np.nan
+    )
+    classifier = get_classifier(system_name)
+    classified["texture_class"] = pd.Categorical.from_codes(
+        classifier.classify_codes(points), categories=classifier.class_names
+    )
+    return classified
+
+
+@st.cache_data
+def classified_csv(
+    data: bytes, system_name: str, sand_col: str, silt_col: str, clay_col: str
+) -> bytes:
+    """Serialize the classified samples for download once per classification."""
+    classified = classify_df(data, system_name, sand_col, silt_col, clay_col)
+    if HAVE_PYARROW:
+        # Arrow's C++ writer is much faster than DataFrame.to_csv.
+        buffer = io.BytesIO()
+        try:
+            table = pa.Table.from_pandas(classified, preserve_index=False)
+            pa_csv.write_csv(table, buffer)
+            return buffer.getvalue()
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # e.g. object columns with mixed types; let pandas write them
+    return classified.to_csv(index=False).encode()
+
+
+@st.cache_resource
+def get_colormap_names() -> tuple[str, ...]:
+    """Sorted Matplotlib colormap names, computed once per process."""
+    # Only reached after an upload, so the empty first page skips this import.
+    from matplotlib import colormaps
+
+    return tuple(sorted(colormaps))
+
+
+@st.cache_data
+def get_texture_systems() -> dict[str, str]:
+    return list_texture_systems()
 
 
 def main():
@@ -20,7 +106,7 @@ def main():
     if uploaded is None:
         st.stop()
 
-    df = pd.read_csv(uploaded)
+    df = load_csv(uploaded.getvalue())
     st.write("Preview of uploaded data:")
     st.dataframe(df.head())
 
@@ -49,12 +135,12 @@ def main():
         st.stop()  # do not proceed further
 
     st.subheader("Plot settings")
-    systems = list_texture_systems()
+    systems = get_texture_systems()
     system_name = st.selectbox("Texture system", list(systems.keys()), index=0)
     st.markdown(systems[system_name])
 
     # Get a list of all available colormaps from matplotlib
-    available_cmaps = sorted(list(colormaps))
+    available_cmaps = get_colormap_names()
 
     # Set 'Set3_r' as default if it's available
     default_cmap_index = 0
@@ -75,14 +161,25 @@ def main():
     )
 
     if uploaded is not None:
-        tri = SoilTextureTriangle(system_name=system_name)
-        tri.load_dataframe(df, sand_col=sand_col, silt_col=silt_col, clay_col=clay_col)
-        classified = tri.classify()
-        fig, ax = tri.plot(size_by=size_by or None, cmap=cmap_selection)
+        classified = classify_df(
+            uploaded.getvalue(), system_name, sand_col, silt_col, clay_col
+        )
+        fig, _ax = plot_triangle_with_points(
+            df=classified,
+            system=get_texture_system(system_name),
+            size_by=size_by or None,
+            size_min=40,
+            size_max=160,
+            show_labels=True,
+            color_points="black",
+            cmap=cmap_selection,
+        )
         st.pyplot(fig)
         st.download_button(
             "Download classified CSV",
-            data=classified.to_csv(index=False),
+            data=classified_csv(
+                uploaded.getvalue(), system_name, sand_col, silt_col, clay_col
+            ),
             file_name="classified_soil_texture.csv",
             mime="text/csv",
         )
@@ -0,0 +1,86 @@
+"""
+Numba point-in-polygon kernel used by :class:`~soiltextureplot.PolygonClassifier`.
+
+Importing this module requires the optional ``numba`` dependency; the
+classifier falls back to its NumPy implementation when it is missing.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# A float64 literal would promote the normalisation; keep it float32 so the
+# kernel matches the NumPy path bit for bit.
+_HUNDRED = np.float32(100.0)
+
+
+# No fastmath: reciprocal division and fused multiply-adds change rounding,
+# so points exactly on a class boundary could disagree with the NumPy path.
+@njit(parallel=True, cache=True)
+def classify_kernel(
+    clay,
+    sand,
+    silt,
+    edges_x0,
+    edges_y0,
+    edges_y1,
+    edges_dx,
+    poly_starts,
+    poly_ends,
+    bboxes,
+    out,
+):
+    """
+    Write the index of the first polygon containing each point into ``out``.
+
+    Points are given as raw (clay, sand, silt) percentages and normalised to
+    the (sand, silt) plane on the fly, so no intermediate arrays are built.
+    Polygon ``k`` is made of the edges ``poly_starts[k]:poly_ends[k]``, each
+    given by its lower end point, upper y and ``dx``, and is bounded by
+    ``bboxes[k] = (xmin, xmax, ymin, ymax, smin, smax)`` with ``s = x + y``.
+    A point on an edge counts as left of it. Points outside every polygon,
+    and all-zero points, get ``-1``.
+    """
+    for i in prange(clay.shape[0]):
+        out[i] = -1
+        total = clay[i] + sand[i] + silt[i]
+        if total == 0:
+            continue
+        x = sand[i] * _HUNDRED / total
+        y = silt[i] * _HUNDRED / total
+        for k in range(poly_starts.shape[0]):
+            if (
+                x < bboxes[k, 0]
+                or x > bboxes[k, 1]
+                or y < bboxes[k, 2]
+                or y > bboxes[k, 3]
+                or x + y < bboxes[k, 4]
+                or x + y > bboxes[k, 5]
+            ):
+                continue
+            inside = False
+            for e in range(poly_starts[k], poly_ends[k]):
+                y0 = edges_y0[e]
+                y1 = edges_y1[e]
+                if (
+                    y0 <= y < y1
+                    and (x - edges_x0[e]) * (y1 - y0) <= (y - y0) * edges_dx[e]
+                ):
+                    inside = not inside
+            if inside:
+                out[i] = k
+                break
+
+
+def _warm_up() -> None:
+    """Compile (or load from cache) the kernel for the dtypes used at runtime."""
+    points = np.zeros(1, dtype=np.float32)
+    edges = np.zeros(1, dtype=np.float32)
+    bounds = np.zeros(1, dtype=np.intp)
+    bboxes = np.zeros((1, 6), dtype=np.float32)
+    out = np.empty(1, dtype=np.int16)
+    classify_kernel(
+        points, points, points, edges, edges, edges, edges, bounds, bounds, bboxes, out
+    )
+
+
+_warm_up()
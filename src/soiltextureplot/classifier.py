@@ -1,11 +1,30 @@
-from dataclasses import dataclass
-from typing import Dict, List
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
-from matplotlib.path import Path
 
 from .systems import TextureSystem
-from .utils import ternary_to_cartesian
+
+# Padding of the sand + silt bound, in percent.
+_SUM_PAD = 1e-3
+
+# How far, in percent, polygons are extended past the sand = 0 and clay = 0
+# sides of the triangle; see _extend_past_sides.
+_SIDE_PAD = 1e-3
+
+try:
+    from ._pip_numba import classify_kernel
+
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; use the NumPy implementation instead
+    _HAVE_NUMBA = False
+
+# numba's workqueue threading layer aborts the process when a parallel kernel
+# is entered from two threads at once (e.g. concurrent Streamlit sessions).
+# The kernel already uses every core, so serialising the calls costs nothing.
+_KERNEL_LOCK = threading.Lock()
 
 
 @dataclass
@@ -17,21 +36,62 @@ class PolygonClassifier:
     ----------
     system : TextureSystem
         The texture system definition containing polygon vertices.
-    _paths : Dict[str, Path]
-        Precomputed matplotlib Paths for point testing.
+    _edges : np.ndarray
+        Non-horizontal polygon edges of all classes stacked into one float32
+        array of shape (E, 4) with columns (x0, y0, y1, dx) in the
+        (sand, silt) plane. Each edge runs upwards from its lower end
+        (x0, y0), so ``y0 < y1``, and ``dx = x1 - x0``. Classes sharing an
+        edge thus store it identically.
+    _edge_starts : np.ndarray
+        Index of the first edge of each polygon in ``_edges``, shape (K,).
+    _edge_ends : np.ndarray
+        Index one past the last edge of each polygon in ``_edges``, shape (K,).
+    _bboxes : np.ndarray
+        Bounds of each polygon as a float32 array of shape (K, 6) with columns
+        (xmin, xmax, ymin, ymax, smin, smax), where s = x + y is sand + silt,
+        i.e. 100 - clay. Together they bound the polygon along all three
+        ternary axes.
     _class_order : List[str]
-        Ordered list of class names for consistency.
+        Class names in the order they are tested, following
+        ``system.priority``.
+    _labels : np.ndarray
+        Object array of ``_class_order`` followed by ``"Unknown"``, indexed by
+        class id (-1 selects ``"Unknown"``). Derived from ``_class_order``.
+    _codes : np.ndarray
+        Position in :attr:`class_names` of each class id, laid out like
+        ``_labels``. Derived from ``_class_order``.
     """
 
     system: TextureSystem
-    _paths: Dict[str, Path]
+    _edges: np.ndarray
+    _edge_starts: np.ndarray
+    _edge_ends: np.ndarray
+    _bboxes: np.ndarray
     _class_order: List[str]
+    _labels: np.ndarray = field(init=False, repr=False)
+    _codes: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._labels = np.array(self._class_order + ["Unknown"], dtype=object)
+        position = {name: i for i, name in enumerate(self.class_names)}
+        self._codes = np.array(
+            [position[name] for name in self._labels], dtype=np.int16
+        )
+
+    @property
+    def class_names(self) -> Tuple[str, ...]:
+        """Class names in system order followed by ``"Unknown"``."""
+        return tuple(self.system.polygons) + ("Unknown",)
 
     @classmethod
+    @lru_cache(maxsize=16)
     def from_system(cls, system: TextureSystem) -> "PolygonClassifier":
         """
         Create a classifier from a TextureSystem.
 
+        Classifiers are cached per system, so repeated calls return the same
+        instance without rebuilding the polygon geometry.
+
         Parameters
         ----------
         system : TextureSystem
@@ -42,34 +102,91 @@ class PolygonClassifier:
         PolygonClassifier
             Initialized classifier instance.
         """
-        paths: Dict[str, Path] = {}
+        edges: List[np.ndarray] = []
+        edge_starts: List[int] = []
+        bboxes: List[List[float]] = []
+        n_edges = 0
 
-        for name, vertices in system.polygons.items():
-            verts = np.array(vertices, dtype=float)  # shape (N, 3) (clay, sand, silt)
-            clay, sand, silt = verts.T
-            xy = ternary_to_cartesian(clay, sand, silt)
-            # Ensure polygon is closed
-            if not np.allclose(xy[0], xy[-1]):
-                xy = np.vstack([xy, xy[0]])
+        # Test the most common classes first so most points exit early.
+        rank = {name: i for i, name in enumerate(system.priority)}
+        class_order = sorted(system.polygons, key=lambda c: rank.get(c, len(rank)))
 
-            paths[name] = Path(xy)
+        rings: Dict[str, np.ndarray] = {}
+        for name, verts in zip(system.polygons, system.vertices):
+            # shape (N, 3) (clay, sand, silt)
+            verts = verts.astype(np.float32)
+            xy = np.column_stack(_ternary_plane(*verts.T))
+            # Drop a duplicate closing vertex; rings are closed below.
+            if len(xy) > 1 and xy[0, 0] == xy[-1, 0] and xy[0, 1] == xy[-1, 1]:
+                xy = xy[:-1]
+            rings[name] = xy
+        corners = np.unique(np.vstack(list(rings.values())), axis=0)
 
-        class_order = list(system.polygons.keys())
-        return cls(system=system, _paths=paths, _class_order=class_order)
+        for name in class_order:
+            xy = _split_at_vertices(rings[name], corners)
+            xy = _extend_past_sides(xy)
+            xy = np.concatenate([xy, xy[:1]])
+
+            # One row per edge: (x0, y0, y1, dx), oriented upwards. Horizontal
+            # edges never cross a horizontal ray, so they are dropped.
+            (x0, y0), (x1, y1) = xy[:-1].T, xy[1:].T
+            keep = y0 != y1
+            x0, y0, x1, y1 = x0[keep], y0[keep], x1[keep], y1[keep]
+            down = y1 < y0
+            x0[down], x1[down] = x1[down], x0[down]
+            y0[down], y1[down] = y1[down], y0[down]
+            edges.append(np.column_stack([x0, y0, y1, x1 - x0]))
+            edge_starts.append(n_edges)
+            n_edges += len(x0)
+            x, y = xy.T
+            # The clay bound (diagonal in this plane) is padded slightly so
+            # rounding in x + y never rejects a point on the polygon's edge.
+            xy_sum = x + y
+            bboxes.append(
+                [
+                    x.min(),
+                    x.max(),
+                    y.min(),
+                    y.max(),
+                    xy_sum.min() - _SUM_PAD,
+                    xy_sum.max() + _SUM_PAD,
+                ]
+            )
+
+        starts = np.array(edge_starts, dtype=np.intp)
+        return cls(
+            system=system,
+            _edges=np.vstack(edges),
+            _edge_starts=starts,
+            _edge_ends=np.append(starts[1:], n_edges),
+            _bboxes=np.array(bboxes, dtype=np.float32),
+            _class_order=class_order,
+        )
 
     def classify_points(
-        self, clay: np.ndarray, sand: np.ndarray, silt: np.ndarray
+        self,
+        clay: np.ndarray,
+        sand: Optional[np.ndarray] = None,
+        silt: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """
         Classify many points at once.
 
+        A point exactly on the line between two classes goes to the class
+        with more clay; on a line of constant sand, to the class with less
+        sand, and on a line of constant silt, to the class with more silt.
+        This matches the published USDA class definitions (40 % clay, 20 %
+        sand is silty clay, not silty clay loam) and applies to every system.
+        Points on the sides of the triangle belong to the class they border.
+
         Parameters
         ----------
         clay : np.ndarray
-            Array of clay percentages.
-        sand : np.ndarray
+            Array of clay percentages, or an (N, 3) array of packed
+            (clay, sand, silt) rows when ``sand`` and ``silt`` are omitted.
+        sand : np.ndarray, optional
             Array of sand percentages.
-        silt : np.ndarray
+        silt : np.ndarray, optional
             Array of silt percentages.
 
         Returns
@@ -78,16 +195,240 @@ class PolygonClassifier:
             Array of class names (dtype=object). Returns 'Unknown' if no
             polygon contains the point.
         """
-        xy = ternary_to_cartesian(clay, sand, silt)
-        n = xy.shape[0]
-        result = np.full(n, "Unknown", dtype=object)
-
-        # Vectorized point-in-polygon: test all points against each Path
-        for class_name in self._class_order:
-            path = self._paths[class_name]
-            inside = path.contains_points(xy)
-            # Only overwrite where still Unknown
-            mask = inside & (result == "Unknown")
-            result[mask] = class_name
+        # Index -1 (no containing polygon) picks the trailing "Unknown".
+        return self._labels[self._class_ids(clay, sand, silt)]
+
+    def classify_codes(
+        self,
+        clay: np.ndarray,
+        sand: Optional[np.ndarray] = None,
+        silt: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Classify many points into positions in :attr:`class_names`.
+
+        Takes the same arguments as :meth:`classify_points`. The result can be
+        turned into labels cheaply, e.g. with
+        ``pd.Categorical.from_codes(codes, categories=classifier.class_names)``.
+
+        Returns
+        -------
+        np.ndarray
+            int16 array of indices into :attr:`class_names`; points outside
+            every polygon get the index of ``"Unknown"``.
+        """
+        return self._codes[self._class_ids(clay, sand, silt)]
+
+    def _class_ids(
+        self,
+        clay: np.ndarray,
+        sand: Optional[np.ndarray],
+        silt: Optional[np.ndarray],
+    ) -> np.ndarray:
+        """Index into ``_class_order`` for each point, or -1 if unclassified."""
+        if sand is None or silt is None:
+            clay, sand, silt = np.asarray(clay).T
+
+        # Cast once at the boundary: the geometry is float32 throughout, and
+        # the numba kernel expects contiguous float32 arrays.
+        clay = np.ascontiguousarray(clay, dtype=np.float32)
+        sand = np.ascontiguousarray(sand, dtype=np.float32)
+        silt = np.ascontiguousarray(silt, dtype=np.float32)
+
+        if _HAVE_NUMBA:
+            # The kernel normalises each point itself; no temporaries needed.
+            class_id = np.empty(clay.shape[0], dtype=np.int16)
+            x0, y0, y1, dx = np.ascontiguousarray(self._edges.T)
+            with _KERNEL_LOCK:
+                classify_kernel(
+                    clay,
+                    sand,
+                    silt,
+                    x0,
+                    y0,
+                    y1,
+                    dx,
+                    self._edge_starts,
+                    self._edge_ends,
+                    self._bboxes,
+                    class_id,
+                )
+        else:
+            px, py = _ternary_plane(clay, sand, silt)
+            class_id = self._classify_ids(px, py)
+
+        return class_id
+
+    def _classify_ids(self, px: np.ndarray, py: np.ndarray) -> np.ndarray:
+        """
+        NumPy fallback returning the index of the containing class per point.
+
+        Parameters
+        ----------
+        px, py : np.ndarray
+            Normalised sand and silt percentages of the points.
+
+        Returns
+        -------
+        np.ndarray
+            Index into ``_class_order`` for each point, or -1 if no polygon
+            contains it.
+        """
+        # Sort the points by y once. Any subset picked in index order below
+        # stays sorted, so the points whose y lies within an edge's span form a
+        # contiguous run found by binary search, and the crossing test only
+        # touches those instead of every candidate.
+        order = np.argsort(py)
+        px = px[order]
+        py = py[order]
+        class_id = np.full(px.shape[0], -1, dtype=np.int16)
+        n_unknown = px.shape[0]
+
+        for k, (start, end) in enumerate(zip(self._edge_starts, self._edge_ends)):
+            # Cheap reject: a polygon can only contain points inside its
+            # bounding box. Its y-range is one sorted run; x is masked within.
+            # (The sand + silt bound only pays off in the numba kernel; here
+            # the extra mask costs more than the crossing tests it saves.)
+            xmin, xmax, ymin, ymax = self._bboxes[k, :4]
+            lo = np.searchsorted(py, ymin, side="left")
+            hi = np.searchsorted(py, ymax, side="right")
+            run_x = px[lo:hi]
+            # The first class (in _class_order) containing a point wins.
+            candidate = (run_x >= xmin) & (run_x <= xmax) & (class_id[lo:hi] < 0)
+            idx = lo + np.flatnonzero(candidate)
+            if idx.size == 0:
+                continue
+            qx = px[idx]
+            qy = py[idx]
 
+            # Crossing-number (PNPOLY) test: a ray cast from the point in +x
+            # crosses an edge when y0 <= y < y1 and the point lies left of or
+            # on the edge. Inside when the count is odd. Comparing products
+            # instead of using a slope keeps the test exact for points on an
+            # edge with round coordinates, so boundary ties break as
+            # documented in classify_points.
+            inside = np.zeros(idx.size, dtype=bool)
+            for x0, y0, y1, dx in self._edges[start:end]:
+                first, stop = np.searchsorted(qy, (y0, y1))
+                if first == stop:
+                    continue
+                run = slice(first, stop)
+                inside[run] ^= (qx[run] - x0) * (y1 - y0) <= (qy[run] - y0) * dx
+            hit = idx[inside]
+            class_id[hit] = k
+            # Stop as soon as every point has a class; with the classes in
+            # priority order this usually skips the rarest polygons.
+            n_unknown -= hit.size
+            if n_unknown == 0:
+                break
+
+        result = np.empty_like(class_id)
+        result[order] = class_id
         return result
+
+
+def _ternary_plane(
+    clay: np.ndarray, sand: np.ndarray, silt: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Map ternary points to the (sand, silt) plane, normalised to sum to 100.
+
+    Polygon inclusion is tested in this plane rather than in Cartesian
+    coordinates. The two differ by a shear along x and a scaling of y, which
+    keeps horizontal rays horizontal and the left/right order along them,
+    so the crossing test gives the same answer for less arithmetic.
+    All-zero rows have no composition and map to NaN, which no polygon
+    contains.
+    """
+    total = clay + sand + silt
+    total[total == 0] = np.nan
+    return sand * 100.0 / total, silt * 100.0 / total
+
+
+def _split_at_vertices(xy: np.ndarray, corners: np.ndarray) -> np.ndarray:
+    """
+    Insert into a polygon ring the other classes' vertices lying on its edges.
+
+    Where a class borders two others along one straight edge, the edge is
+    split at the vertex between them, so classes sharing a boundary share
+    exactly the same edges and no point on it falls between them. The
+    coordinates are float32, so the collinearity test is exact in float64.
+
+    Parameters
+    ----------
+    xy : np.ndarray
+        Open (unclosed) ring of (x, y) vertices, shape (N, 2).
+    corners : np.ndarray
+        Vertices of all classes, shape (M, 2).
+
+    Returns
+    -------
+    np.ndarray
+        The open ring with the vertices inserted, float32.
+    """
+    xy = xy.astype(np.float64)
+    corners = corners.astype(np.float64)
+    ring = []
+    for a, b in zip(xy, np.roll(xy, -1, axis=0)):
+        ring.append(a)
+        d = b - a
+        rel = corners - a
+        t = (rel @ d) / (d @ d)
+        on_edge = (rel[:, 0] * d[1] == rel[:, 1] * d[0]) & (t > 0.0) & (t < 1.0)
+        ring.extend(corners[on_edge][np.argsort(t[on_edge])])
+    return np.array(ring, dtype=np.float32)
+
+
+def _extend_past_sides(xy: np.ndarray) -> np.ndarray:
+    """
+    Extend a polygon ring past the sand = 0 and clay = 0 sides of the triangle.
+
+    The crossing test gives a point on a class boundary to the class on its
+    left (less sand), and in the (sand, silt) plane the sand = 0 side
+    (x = 0) is a left edge of every polygon along it, so points on it would
+    belong to no class. Each vertex on that side, or on the clay = 0 side
+    (x + y = 100), gets a copy moved ``_SIDE_PAD`` outside the triangle
+    along its edge into the triangle, and vertices in the middle of a side
+    are dropped. Edges inside the triangle keep their exact end points, and
+    classes sharing a vertex on a side share its copy, so they still tile.
+
+    Parameters
+    ----------
+    xy : np.ndarray
+        Open (unclosed) ring of (x, y) vertices, shape (N, 2).
+
+    Returns
+    -------
+    np.ndarray
+        The extended open ring, float32.
+    """
+    x, y = xy.T.astype(np.float64)
+    on_left = x <= _SUM_PAD
+    on_right = x + y >= 100.0 - _SUM_PAD
+    ring: List[Tuple[float, float]] = []
+    n = len(xy)
+    for i in range(n):
+        v = (x[i], y[i])
+        if on_left[i] and on_right[i]:
+            # The silt corner: outside both sides.
+            ring.append((-_SIDE_PAD, 100.0 + 2.0 * _SIDE_PAD))
+            continue
+        if not (on_left[i] or on_right[i]):
+            ring.append(v)
+            continue
+        side = on_left if on_left[i] else on_right
+        prev, nxt = (i - 1) % n, (i + 1) % n
+        if side[prev] == side[nxt]:
+            # Mid-side (dropped), or touching the side at one vertex (kept).
+            if not side[prev]:
+                ring.append(v)
+            continue
+        # Slide outwards along the edge to the neighbour off the side.
+        inner = nxt if side[prev] else prev
+        if side is on_left:
+            t = _SIDE_PAD / (x[inner] - x[i])
+        else:
+            t = _SIDE_PAD / (x[i] + y[i] - x[inner] - y[inner])
+        moved = (x[i] + (x[i] - x[inner]) * t, y[i] + (y[i] - y[inner]) * t)
+        ring.extend([v, moved] if inner == prev else [moved, v])
+    return np.array(ring, dtype=np.float32)
@@ -5,8 +5,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import NoReturn, Optional
 
-import matplotlib
-import matplotlib.pyplot as plt
 import pandas as pd
 import typer
 
@@ -71,15 +69,22 @@ def _save_plot(
     cmap: str,
     color_points: str,
     show_labels: bool,
+    max_labels: Optional[int],
     dpi: int,
 ) -> None:
+    # Imported here so the classify/list commands never load matplotlib.
+    import matplotlib
+
     matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
     try:
         fig, _ax = tri.plot(
             size_by=size_by,
             cmap=cmap,
             color_points=color_points,
             show_labels=show_labels,
+            max_labels=max_labels,
         )
     except (ValueError, KeyError) as exc:
         _fail(str(exc))
@@ -148,6 +153,13 @@ def plot(
         "--show-labels/--no-show-labels",
         help="Show sample_id labels on points.",
     ),
+    max_labels: Optional[int] = typer.Option(
+        None,
+        "--max-labels",
+        min=0,
+        help="Label at most this many samples, spread over the triangle "
+        "(default: label every sample).",
+    ),
     dpi: int = typer.Option(150, "--dpi", help="Figure DPI."),
 ) -> None:
     """Plot samples on a soil texture triangle and save the figure."""
@@ -159,6 +171,7 @@ def plot(
         cmap=cmap,
         color_points=color_points,
         show_labels=show_labels,
+        max_labels=max_labels,
         dpi=dpi,
     )
 
@@ -196,6 +209,13 @@ def run(
         "--show-labels/--no-show-labels",
         help="Show sample_id labels on points.",
     ),
+    max_labels: Optional[int] = typer.Option(
+        None,
+        "--max-labels",
+        min=0,
+        help="Label at most this many samples, spread over the triangle "
+        "(default: label every sample).",
+    ),
     dpi: int = typer.Option(150, "--dpi", help="Figure DPI."),
 ) -> None:
     """Classify samples to CSV and save a texture triangle figure."""
@@ -212,6 +232,7 @@ def run(
         cmap=cmap,
         color_points=color_points,
         show_labels=show_labels,
+        max_labels=max_labels,
         dpi=dpi,
     )
 
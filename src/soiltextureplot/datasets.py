@@ -72,13 +72,13 @@ USDA_TEXTURE_CLASSES: TextureClasses = {
 }
 
 HYPRES_TEXTURE_CLASSES: TextureClasses = {
-    "coarse": [  # Coarse: 0 ≤ clay < 18, sand ≥ 65
+    "coarse": [  # Coarse: 0 ≤ clay < 18, sand > 65
         [18.0, 82.0, 0.0],
         [0.0, 100.0, 0.0],
         [0.0, 65.0, 35.0],
         [18.0, 65.0, 17.0],
     ],
-    "medium": [  # Medium: (0–18 clay & 15–65 sand) OR (18–35 clay & sand ≥15)
+    "medium": [  # Medium: (0–18 clay & 15 < sand ≤ 65) OR (18–35 clay & sand > 15)
         [35.0, 65.0, 0.0],
         [18.0, 82.0, 0.0],
         [18.0, 65.0, 17.0],
@@ -86,7 +86,7 @@ HYPRES_TEXTURE_CLASSES: TextureClasses = {
         [0.0, 15.0, 85.0],
         [35.0, 15.0, 50.0],
     ],
-    "medium fine": [  # Medium fine: (clay<35) and (sand<15)
+    "medium fine": [  # Medium fine: (clay<35) and (sand≤15)
         [35.0, 15.0, 50.0],
         [0.0, 15.0, 85.0],
         [0.0, 0.0, 100.0],
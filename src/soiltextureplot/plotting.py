@@ -1,17 +1,32 @@
-from typing import Any, List, Optional, Protocol, Tuple, Union, cast
+from __future__ import annotations
+
+import math
+import pickle
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+    cast,
+)
 
-import matplotlib.pyplot as plt
-import mpltern  # noqa: F401  # Registers the "ternary" Matplotlib projection.
 import numpy as np
 import pandas as pd
-from matplotlib import colormaps
-from matplotlib.axes import Axes
-from matplotlib.colors import Colormap
-from matplotlib.figure import Figure
-from matplotlib.ticker import AutoMinorLocator, MultipleLocator
 
 from .systems import TextureSystem
-from .utils import calculate_centroid
+from .utils import calculate_centroids, ternary_to_cartesian
+
+if TYPE_CHECKING:
+    # pyplot and mpltern are imported where a figure is first created, so
+    # importing the package (e.g. only to classify) stays cheap.
+    from matplotlib.axes import Axes
+    from matplotlib.colors import Colormap
+    from matplotlib.figure import Figure
 
 
 class TernaryAxisLike(Protocol):
@@ -22,10 +37,11 @@ class TernaryAxisLike(Protocol):
     raxis: Any
     transData: Any
     transTernaryAxes: Any
+    transProjection: Any
 
-    def scatter(self, *args: Any, **kwargs: Any) -> Any: ...
+    def add_collection(self, *args: Any, **kwargs: Any) -> Any: ...
 
-    def fill(self, *args: Any, **kwargs: Any) -> list[Any]: ...
+    def scatter(self, *args: Any, **kwargs: Any) -> Any: ...
 
     def text(self, *args: Any, **kwargs: Any) -> Any: ...
 
@@ -43,6 +59,9 @@ def plot_triangle_with_points(
     show_labels: Optional[bool] = None,
     cmap: Optional[Union[str, List[str], Colormap]] = None,
     color_points: Optional[Union[str, List[str]]] = None,
+    points: Optional[np.ndarray] = None,
+    ax: Optional[Axes] = None,
+    max_labels: Optional[int] = 150,
 ) -> Tuple[Figure, Axes]:
     """
     Plot soil texture data on a ternary diagram.
@@ -54,7 +73,8 @@ def plot_triangle_with_points(
     system : TextureSystem
         The soil texture classification system to use.
     size_by : str, optional
-        Column name to use for sizing points.
+        Column name to use for sizing points. Sizes are scaled linearly
+        between ``size_min`` and ``size_max``.
     size_min : float, optional
         Minimum point size.
     size_max : float, optional
@@ -65,7 +85,20 @@ def plot_triangle_with_points(
         Colormap for filling texture classes. Can be a matplotlib colormap name
         or a list of colors. Defaults to 'Set3_r'.
     color_points : str or list, optional
-        Color for the scattered points.
+        Color for the scattered points. Defaults to the property-cycle colour
+        following one per texture class (e.g. 'C2' for USDA's 12 classes).
+    points : np.ndarray, optional
+        (N, 3) array of (clay, sand, silt) rows matching ``df``. Avoids
+        extracting the columns again when the caller already holds them.
+    ax : Axes, optional
+        Ternary axes already showing the texture classes of ``system``, e.g.
+        from :func:`plot_texture_classes`. Only the points are drawn on it and
+        ``cmap`` is ignored.
+    max_labels : int, optional
+        Upper bound on the number of sample labels drawn when ``show_labels``
+        is set. Larger datasets are thinned to one label per region of the
+        triangle, since overlapping labels are unreadable and slow to draw.
+        None draws every label. Must not be negative.
 
     Returns
     -------
@@ -74,45 +107,146 @@ def plot_triangle_with_points(
     ax : Axes
         The matplotlib Axes object (ternary projection).
     """
+    if max_labels is not None and max_labels < 0:
+        raise ValueError(f"max_labels must be >= 0, got {max_labels}")
 
-    fig = plt.figure(figsize=(7, 6))
-    ax = cast(TernaryAxisLike, fig.add_subplot(projection="ternary", ternary_sum=100.0))
-
-    _plot_background_classes(ax, system, cmap=cmap)
+    if ax is None:
+        fig, ax = _new_background(system, cmap)
+    else:
+        fig = cast("Figure", ax.get_figure())
+    tax = cast(TernaryAxisLike, ax)
 
     # coordinates in ternary order (clay, sand, silt)
-    t = df["clay"].to_numpy()
-    left = df["sand"].to_numpy()
-    r = df["silt"].to_numpy()
+    if points is None:
+        points = df[["clay", "sand", "silt"]].to_numpy(
+            dtype=np.float32, na_value=np.nan
+        )
+    t, left, r = points.T
 
     sizes = _compute_sizes(df, size_by, size_min, size_max)
 
-    ax.scatter(
-        t,
-        left,
-        r,
-        c=color_points,
-        alpha=0.7,
-        edgecolors="none",
-        s=sizes,
-    )
+    if color_points is None:
+        from matplotlib import rcParams
+        from matplotlib.colors import to_hex
+
+        # Filling each class used to advance the colour cycle; keep default
+        # points in the colour that follows the classes.
+        cycle = rcParams["axes.prop_cycle"].by_key().get("color")
+        if cycle:
+            color = cycle[len(system.polygons) % len(cycle)]
+            color_points = to_hex(color, keep_alpha=True)
+
+    if isinstance(color_points, str):
+        _add_markers(tax, points, sizes, color_points)
+    else:
+        tax.scatter(
+            t,
+            left,
+            r,
+            c=color_points,
+            alpha=0.7,
+            edgecolors="none",
+            s=sizes,
+        )
 
     if show_labels and "sample_id" in df.columns:
-        for (_, row), tt, ll, rr in zip(df.iterrows(), t, left, r):
-            ax.text(
+        labels = df["sample_id"].to_numpy()
+        keep = _thin_labels(points, max_labels)
+        for tt, ll, rr, label in zip(t[keep], left[keep], r[keep], labels[keep]):
+            tax.text(
                 tt,
                 ll,
                 rr,
-                row["sample_id"],
+                label,
                 fontsize=7,
                 ha="center",
                 va="center",
                 color="white",
             )
 
-    ax.set_title(f"{system.name} Soil Texture Triangle", weight="bold", pad=20)
     fig.tight_layout()
-    return fig, cast(Axes, ax)
+    return fig, ax
+
+
+def plot_texture_classes(
+    system: TextureSystem,
+    cmap: Optional[Union[str, List[str], Colormap]] = None,
+) -> Tuple[Figure, Axes]:
+    """
+    Create a ternary diagram showing only the texture classes of a system.
+
+    The result depends only on ``system`` and ``cmap``, so it can be built once
+    and copied (e.g. with ``pickle``) before adding points with
+    :func:`plot_triangle_with_points`.
+
+    Parameters
+    ----------
+    system : TextureSystem
+        The soil texture classification system to draw.
+    cmap : str, list, or Colormap, optional
+        Colormap for filling texture classes. Defaults to 'Set3_r'.
+
+    Returns
+    -------
+    fig : Figure
+        The matplotlib Figure object.
+    ax : Axes
+        The matplotlib Axes object (ternary projection).
+    """
+    import matplotlib.pyplot as plt
+    from mpltern import TernaryAxes
+
+    fig = plt.figure(figsize=(7, 6))
+    # Pass the axes class itself rather than resolving the "ternary"
+    # projection name through Matplotlib's registry on every figure.
+    ax = cast(
+        TernaryAxisLike, fig.add_subplot(axes_class=TernaryAxes, ternary_sum=100.0)
+    )
+
+    _plot_background_classes(ax, system, cmap=cmap)
+
+    ax.set_title(f"{system.name} Soil Texture Triangle", weight="bold", pad=20)
+    return fig, cast("Axes", ax)
+
+
+def _new_background(
+    system: TextureSystem,
+    cmap: Optional[Union[str, List[str], Colormap]],
+) -> Tuple[Figure, Axes]:
+    """
+    Return a fresh texture-class figure, copied from a cached rendering.
+
+    Unpickling a stored figure skips rebuilding the polygons, labels and axes
+    on every replot. The cache is keyed on the current rcParams too, so styles
+    and ``rc_context`` apply as they would to a new figure. Only registered
+    colormap names are cached; lists, Colormap objects and unknown names are
+    drawn from scratch.
+    """
+    from matplotlib import colormaps, rcParams
+
+    if cmap is not None and (not isinstance(cmap, str) or cmap not in colormaps):
+        return plot_texture_classes(system, cmap=cmap)
+    # Raw values, skipping rcParams' per-item validation, as one string since
+    # some of them (lists, cyclers) are not hashable.
+    style = repr(tuple(dict.items(rcParams)))
+    fig = pickle.loads(_background_bytes(system, cmap, style))
+    return fig, fig.axes[0]
+
+
+@lru_cache(maxsize=16)
+def _background_bytes(system: TextureSystem, cmap: Optional[str], style: str) -> bytes:
+    """
+    Pickled :func:`plot_texture_classes` figure per system, colormap and style.
+
+    ``style`` only keys the cache; the figure is drawn with the current
+    rcParams, which it describes.
+    """
+    import matplotlib.pyplot as plt
+
+    fig, _ax = plot_texture_classes(system, cmap=cmap)
+    data = pickle.dumps(fig)
+    plt.close(fig)
+    return data
 
 
 def _plot_background_classes(
@@ -134,6 +268,9 @@ def _plot_background_classes(
     """
     from itertools import cycle
 
+    from matplotlib import colormaps
+    from matplotlib.ticker import AutoMinorLocator, MultipleLocator
+
     num_polygons = len(system.polygons)
 
     colors = None
@@ -143,19 +280,15 @@ def _plot_background_classes(
         if cmap is None:
             cmap = "Set3_r"  # default
         try:
-            colormap = colormaps.get_cmap(cmap)
-            # Resample the colormap to have exactly the number of colors we need.
-            # Then, get the list of colors by calling the resampled map.
-            # This is a robust way that works for both continuous and discrete colormaps.
-            resampled_cmap = colormap.resampled(num_polygons)
-            colors = [resampled_cmap(i) for i in range(resampled_cmap.N)]
+            if isinstance(cmap, str):
+                colors = _resolve_colors(cmap, num_polygons)
+            else:
+                colors = _sample_colors(colormaps.get_cmap(cmap), num_polygons)
         except (ValueError, KeyError):
             print(
                 f"Warning: Colormap '{cmap}' not found. Falling back to default 'Set3_r'."
             )
-            colormap = colormaps.get_cmap("Set3_r")
-            resampled_cmap = colormap.resampled(num_polygons)
-            colors = [resampled_cmap(i) for i in range(resampled_cmap.N)]
+            colors = _resolve_colors("Set3_r", num_polygons)
 
     # Cycle through colors if not enough are provided for the polygons.
     # This is a safeguard, though resampled() should give the correct number.
@@ -165,27 +298,25 @@ def _plot_background_classes(
     else:
         color_cycle = colors
 
-    for (name, vertices), color in zip(system.polygons.items(), color_cycle):
-        tn0, tn1, tn2 = np.array(vertices).T  # clay, sand, silt
-        patch = ax.fill(
-            tn0,
-            tn1,
-            tn2,
-            ec="k",
-            fc=color,
-            alpha=0.5,
-        )
-        centroid = calculate_centroid(patch[0].get_xy())
+    from matplotlib.collections import PolyCollection
 
-        label = name.capitalize()
+    # One collection for all class polygons instead of one patch per class.
+    shapes = _class_shapes(system)
+    polygons = PolyCollection(
+        [ax.transProjection.transform(np.column_stack(shape[:3])) for shape in shapes],
+        facecolors=[color for _, color in zip(shapes, color_cycle)],
+        edgecolors="k",
+        alpha=0.5,
+        joinstyle="miter",  # what the per-class fill patches used
+    )
+    ax.add_collection(polygons, autolim=False)
 
+    for shape in shapes:
         ax.text(
-            centroid[0],
-            centroid[1],
-            label,
+            *shape.centroid,
+            shape.label,
             ha="center",
             va="center",
-            transform=ax.transData,
         )
 
     # ticks, grid, etc. (same as you already have)
@@ -242,6 +373,125 @@ def _plot_background_classes(
     ax.raxis.set_ticks_position("tick2")
 
 
+def _add_markers(
+    ax: TernaryAxisLike,
+    points: np.ndarray,
+    sizes: Union[float, np.ndarray],
+    color: str,
+) -> None:
+    """
+    Draw single-colour sample markers as one PathCollection.
+
+    Equivalent to ``ax.scatter(..., c=color, alpha=0.7, edgecolors="none",
+    s=sizes)`` but skips scatter's per-point colour and mask handling, which
+    is wasted work when every marker has the same colour.
+    """
+    from matplotlib.collections import PathCollection
+    from matplotlib.markers import MarkerStyle
+    from matplotlib.transforms import IdentityTransform
+
+    offsets = ax.transProjection.transform(points)
+    sizes = np.atleast_1d(sizes)
+    # Like scatter, leave out points with a missing coordinate or size.
+    valid = np.isfinite(offsets).all(axis=1)
+    if sizes.size > 1:
+        valid &= np.isfinite(sizes)
+        sizes = sizes[valid]
+    offsets = offsets[valid]
+
+    marker = MarkerStyle("o")
+    markers = PathCollection(
+        (marker.get_path().transformed(marker.get_transform()),),
+        sizes,
+        facecolors=color,
+        edgecolors="none",
+        offsets=offsets,
+        offset_transform=ax.transData,
+        alpha=0.7,
+    )
+    markers.set_transform(IdentityTransform())
+    # The ternary axes have fixed limits, so skip data-limit updates.
+    ax.add_collection(markers, autolim=False)
+
+
+class _ClassShape(NamedTuple):
+    """Drawing data of one texture class, in ternary (clay, sand, silt) order."""
+
+    clay: np.ndarray
+    sand: np.ndarray
+    silt: np.ndarray
+    centroid: Tuple[float, float, float]
+    label: str
+
+
+@lru_cache(maxsize=16)
+def _class_shapes(system: TextureSystem) -> Tuple[_ClassShape, ...]:
+    """
+    Vertex arrays, label positions and label text of every class, per system.
+
+    The polygons are static, so this is computed once per system instead of
+    on every plot.
+    """
+    vertices = system.vertices
+    # mpltern draws each vertex normalised to ternary_sum. After that the
+    # (sand, silt) plane is an affine image of the drawn triangle, and
+    # centroids are preserved by affine maps, so it gives the label positions.
+    normalised = [100.0 * v / v.sum(axis=1, keepdims=True) for v in vertices]
+    centroids = calculate_centroids([v[:, 1:] for v in normalised])
+
+    return tuple(
+        _ClassShape(
+            clay=v[:, 0],
+            sand=v[:, 1],
+            silt=v[:, 2],
+            centroid=(100.0 - sand - silt, sand, silt),
+            label=system.labels[name],
+        )
+        for name, v, (sand, silt) in zip(system.polygons, vertices, centroids)
+    )
+
+
+@lru_cache(maxsize=64)
+def _resolve_colors(cmap_name: str, n: int) -> Tuple[Tuple[float, ...], ...]:
+    """Cached :func:`_sample_colors` for a registered colormap name."""
+    from matplotlib import colormaps
+
+    return _sample_colors(colormaps.get_cmap(cmap_name), n)
+
+
+def _sample_colors(colormap: Colormap, n: int) -> Tuple[Tuple[float, ...], ...]:
+    """
+    Sample exactly ``n`` RGBA colors from a colormap.
+
+    Resampling works for both continuous and discrete colormaps.
+    """
+    resampled_cmap = colormap.resampled(n)
+    return tuple(tuple(resampled_cmap(i)) for i in range(resampled_cmap.N))
+
+
+def _thin_labels(points: np.ndarray, max_labels: Optional[int]) -> np.ndarray:
+    """
+    Select the samples to label, keeping at most ``max_labels`` of them.
+
+    The triangle is split into a square grid in Cartesian space and only the
+    first sample of each occupied cell is labelled, so the labels stay spread
+    over the data instead of piling up where samples are dense.
+    """
+    n = points.shape[0]
+    if max_labels is None or n <= max_labels:
+        return np.arange(n)
+
+    xy = ternary_to_cartesian(points)
+    finite = np.flatnonzero(np.isfinite(xy).all(axis=1))
+    # The triangle fills half of its bounding square, hence 2 * max_labels.
+    cells_per_side = max(1, math.isqrt(2 * max_labels))
+    cell = np.clip(
+        (xy[finite] / 100.0 * cells_per_side).astype(np.intp), 0, cells_per_side - 1
+    )
+    _, first = np.unique(cell[:, 0] * cells_per_side + cell[:, 1], return_index=True)
+    return np.sort(finite[first])[:max_labels]
+
+
 def _compute_sizes(
     df: pd.DataFrame,
     size_by: Optional[str],
@@ -257,12 +507,24 @@ def _compute_sizes(
     if size_max is None:
         size_max = 100.0  # default fallback
 
-    vals = df[size_by].to_numpy().astype(float)
-    valid = np.isfinite(vals)
-    if not valid.any() or np.allclose(vals[valid], vals[valid][0]):
-        return np.full_like(vals, (size_min + size_max) / 2.0)
-
-    vmin = vals[valid].min()
-    vmax = vals[valid].max()
-    norm = (vals - vmin) / (vmax - vmin)
-    return size_min + norm * (size_max - size_min)
+    # One float32 copy, scaled in place below.
+    vals = df[size_by].to_numpy(dtype=np.float32, na_value=np.nan, copy=True)
+    if vals.size == 0:
+        return vals
+
+    # fmin/fmax skip NaN in a single pass without the all-NaN warning.
+    vmin = np.fmin.reduce(vals)
+    vmax = np.fmax.reduce(vals)
+    if np.isinf(vmin) or np.isinf(vmax):
+        # Rare: infinities must not stretch the range, so mask them out.
+        finite = vals[np.isfinite(vals)]
+        vmin = finite.min() if finite.size else np.nan
+        vmax = finite.max() if finite.size else np.nan
+    if np.isnan(vmin) or np.isclose(vmin, vmax):
+        vals.fill((size_min + size_max) / 2.0)
+        return vals
+
+    np.subtract(vals, vmin, out=vals)
+    np.multiply(vals, (size_max - size_min) / (vmax - vmin), out=vals)
+    np.add(vals, size_min, out=vals)
+    return vals
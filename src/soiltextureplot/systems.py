@@ -1,14 +1,19 @@
-from dataclasses import dataclass
-from typing import Any, Dict, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Sequence, Tuple
+
+import numpy as np
 
 from . import datasets
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class TextureSystem:
     """
     Represents a soil texture classification system.
 
+    Systems compare and hash by identity, so each instance keys the
+    classifier and plotting caches on its own.
+
     Parameters
     ----------
     name : str
@@ -17,11 +22,37 @@ class TextureSystem:
         A mapping of class names to polygon vertices.
     meta : Mapping[str, Any]
         Metadata about the system (description, citation, etc.).
+    priority : Sequence[str], optional
+        Class names from most to least frequently expected in samples. The
+        classifier tests classes in this order (unlisted classes last), so
+        common classes are found early. Purely a performance hint: polygons
+        do not overlap, so it does not change the classification.
+
+    Attributes
+    ----------
+    labels : Mapping[str, str]
+        Display label of each class, built once when the system is created.
+    vertices : Tuple[np.ndarray, ...]
+        Read-only float64 (N, 3) (clay, sand, silt) vertex array of each class,
+        in ``polygons`` order, shared by the classifier and plotting.
     """
 
     name: str
     polygons: Mapping[str, Any]
     meta: Mapping[str, Any]
+    priority: Sequence[str] = ()
+    labels: Mapping[str, str] = field(init=False, repr=False)
+    vertices: Tuple[np.ndarray, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Frozen, so set the derived fields through object.__setattr__.
+        object.__setattr__(
+            self, "labels", {name: name.capitalize() for name in self.polygons}
+        )
+        vertices = tuple(np.array(v, dtype=float) for v in self.polygons.values())
+        for v in vertices:
+            v.setflags(write=False)
+        object.__setattr__(self, "vertices", vertices)
 
 
 _SYSTEMS: Dict[str, TextureSystem] = {
@@ -31,6 +62,20 @@ _SYSTEMS: Dict[str, TextureSystem] = {
         meta={
             "description": "United States Department of Agriculture (USDA) Soil Texture Classification"
         },
+        priority=(
+            "loam",
+            "silt loam",
+            "sandy loam",
+            "clay loam",
+            "silty clay loam",
+            "clay",
+            "sandy clay loam",
+            "loamy sand",
+            "silty clay",
+            "sand",
+            "silt",
+            "sandy clay",
+        ),
     ),
     "HYPRES": TextureSystem(
         name="HYPRES",
@@ -38,10 +83,14 @@ _SYSTEMS: Dict[str, TextureSystem] = {
         meta={
             "description": "The HYdraulic PRoperties of European Soils (HYPRES) is a European framework for classifying soils based on their hydrologic properties"
         },
+        priority=("medium", "medium fine", "coarse", "fine", "very fine"),
     ),
     # additional systems can be added here
 }
 
+# Names for error messages, built once rather than on every failed lookup.
+_SYSTEM_NAMES = tuple(_SYSTEMS)
+
 
 def get_texture_system(system_name: str) -> TextureSystem:
     """
@@ -62,12 +111,12 @@ def get_texture_system(system_name: str) -> TextureSystem:
     ValueError
         If the system name is not found.
     """
-    try:
-        return _SYSTEMS[system_name]
-    except KeyError:
+    system = _SYSTEMS.get(system_name)
+    if system is None:
         raise ValueError(
-            f"Unknown texture system {system_name!r}. Available: {list(_SYSTEMS)}"
+            f"Unknown texture system {system_name!r}. Available: {_SYSTEM_NAMES}"
         )
+    return system
 
 
 def list_texture_systems() -> Dict[str, str]:
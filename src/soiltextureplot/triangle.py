@@ -2,17 +2,17 @@ from dataclasses import dataclass, field
 from pathlib import Path as PathLibPath
 from typing import TYPE_CHECKING, Optional, Union
 
+import numpy as np
 import pandas as pd
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
 
 from . import plotting
 from .classifier import PolygonClassifier
 from .systems import TextureSystem, get_texture_system
 
 if TYPE_CHECKING:
-    # Avoid circular import at runtime by only importing for type checking if needed
-    pass
+    # Only needed for annotations; matplotlib is loaded when plotting.
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 
 @dataclass
@@ -33,6 +33,7 @@ class SoilTextureTriangle:
 
     def __post_init__(self):
         self.system: TextureSystem = get_texture_system(self.system_name)
+        # Cached per system, so constructing many triangles is cheap.
         self._classifier = PolygonClassifier.from_system(self.system)
 
     # data loading
@@ -62,7 +63,14 @@ class SoilTextureTriangle:
         SoilTextureTriangle
             Self for chaining.
         """
-        df = pd.read_csv(path)
+        # Columns keep their parsed dtypes so writing the data back (e.g. from
+        # the CLI) reproduces the input; classification and plotting take their
+        # own float32 copy of the texture columns.
+        try:
+            # Arrow's multi-threaded parser is much faster on large files.
+            df = pd.read_csv(path, engine="pyarrow")
+        except ImportError:  # pyarrow is optional; use pandas' C parser
+            df = pd.read_csv(path)
         return self.load_dataframe(df, sand_col, silt_col, clay_col)
 
     def load_dataframe(
@@ -102,7 +110,7 @@ class SoilTextureTriangle:
         """
         Classify loaded data into texture classes.
 
-        Adds a 'texture_class' column to the internal DataFrame.
+        Adds a categorical 'texture_class' column to the internal DataFrame.
 
         Returns
         -------
@@ -117,12 +125,15 @@ class SoilTextureTriangle:
         if self.df is None:
             raise ValueError("No data loaded. Call load_csv or load_dataframe first.")
 
-        clay = self.df["clay"].to_numpy()
-        sand = self.df["sand"].to_numpy()
-        silt = self.df["silt"].to_numpy()
-
-        classes = self._classifier.classify_points(clay, sand, silt)
-        self.df["texture_class"] = classes
+        points = self._texture_points()
+        # A categorical column stores one small integer code per row instead
+        # of a string object, and assign() avoids __setitem__'s overhead.
+        codes = self._classifier.classify_codes(points)
+        self.df = self.df.assign(
+            texture_class=pd.Categorical.from_codes(
+                codes, categories=self._classifier.class_names
+            )
+        )
         return self.df
 
     # plotting
@@ -134,7 +145,8 @@ class SoilTextureTriangle:
         show_labels: bool = True,
         cmap: Optional[str] = None,
         color_points: Optional[str] = "black",
-    ) -> tuple[Figure, Axes]:
+        max_labels: Optional[int] = 150,
+    ) -> tuple["Figure", "Axes"]:
         """
         Plot current data on the soil texture triangle using mpltern.
 
@@ -152,6 +164,9 @@ class SoilTextureTriangle:
             Colormap name for background polygons.
         color_points : str, optional
             Color for sample points.
+        max_labels : int, optional
+            Maximum number of sample labels; larger datasets are thinned.
+            None labels every sample.
 
         Returns
         -------
@@ -169,10 +184,26 @@ class SoilTextureTriangle:
         return plotting.plot_triangle_with_points(
             df=self.df,
             system=self.system,
+            points=self._texture_points(),
             size_by=size_by,
             size_min=size_min,
             size_max=size_max,
             show_labels=show_labels,
             cmap=cmap,
             color_points=color_points,
+            max_labels=max_labels,
+        )
+
+    def _texture_points(self) -> np.ndarray:
+        """
+        Return the (N, 3) float32 (clay, sand, silt) array of the loaded data.
+
+        Extracted in one pass on every call, so edits made to ``df`` in place
+        are always seen.
+        """
+        assert self.df is not None
+        return np.ascontiguousarray(
+            self.df[["clay", "sand", "silt"]].to_numpy(
+                dtype=np.float32, na_value=np.nan
+            )
         )
@@ -1,3 +1,6 @@
+import math
+from typing import Optional, Sequence
+
 import numpy as np
 
 
@@ -16,28 +19,93 @@ def calculate_centroid(vertices: np.ndarray) -> np.ndarray:
     np.ndarray
         Array of shape (2,) containing the (x, y) centroid coordinates.
     """
-    x = vertices[:, 0]
-    y = vertices[:, 1]
-
-    # Close the polygon
-    x_next = np.roll(x, -1)
-    y_next = np.roll(y, -1)
+    # Close the polygon once; the edge endpoints are then two slice views.
+    closed = np.concatenate([vertices, vertices[:1]])
+    x, x_next = closed[:-1, 0], closed[1:, 0]
+    y, y_next = closed[:-1, 1], closed[1:, 1]
 
     cross = x * y_next - x_next * y
-    area = cross.sum() / 2.0
+    # Plain float comparison; np.isclose costs microseconds on a scalar.
+    area = float(cross.sum()) / 2.0
 
-    if np.isclose(area, 0.0):
+    if abs(area) <= _area_atol(cross):
         # Fallback: simple mean if area is ~0 (degenerate polygon)
-        return np.array([x.mean(), y.mean()])
+        return np.array((x.mean(), y.mean()))
 
     cx = ((x + x_next) * cross).sum() / (6.0 * area)
     cy = ((y + y_next) * cross).sum() / (6.0 * area)
 
-    return np.array([cx, cy])
+    return np.array((cx, cy))
+
+
+def _area_atol(cross: np.ndarray) -> np.ndarray:
+    """
+    Tolerance below which a shoelace area counts as zero.
+
+    1e-8 for float64 input; float32 vertices get a tolerance scaled to their
+    precision and to the size of the terms summed into the area.
+    """
+    eps = np.finfo(np.result_type(cross.dtype, np.float32)).eps
+    return np.maximum(1e-8, eps * np.abs(cross).sum(axis=-1))
+
+
+def calculate_centroids(polygons: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Compute the centroids of several 2D polygons in one vectorized pass.
+
+    Same result as calling :func:`calculate_centroid` on each polygon. The
+    polygons are padded to a common length by repeating their first vertex,
+    which adds only zero-length edges to the shoelace sums.
+
+    Parameters
+    ----------
+    polygons : Sequence[np.ndarray]
+        K arrays of shape (N_i, 2) containing polygon vertices.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (K, 2) containing the (x, y) centroid coordinates.
+    """
+    # Pad with at least one copy of the first vertex, which also closes each
+    # polygon, so the edge endpoints are two slice views.
+    n_closed = max(len(v) for v in polygons) + 1
+    vertices = np.stack(
+        [
+            np.concatenate([v, np.repeat(v[:1], n_closed - len(v), axis=0)])
+            for v in polygons
+        ]
+    )  # shape (K, Nmax + 1, 2)
+    x, x_next = vertices[:, :-1, 0], vertices[:, 1:, 0]
+    y, y_next = vertices[:, :-1, 1], vertices[:, 1:, 1]
+
+    cross = x * y_next - x_next * y
+    area = cross.sum(axis=1) / 2.0
+
+    degenerate = np.abs(area) <= _area_atol(cross)
+    area[degenerate] = 1.0  # avoid dividing by ~0; replaced below
+
+    centroids = np.stack(
+        [
+            ((x + x_next) * cross).sum(axis=1) / (6.0 * area),
+            ((y + y_next) * cross).sum(axis=1) / (6.0 * area),
+        ],
+        axis=-1,
+    )
+
+    # Fallback: simple mean of the real (unpadded) vertices for ~0 area
+    for k in np.flatnonzero(degenerate).tolist():
+        centroids[k] = polygons[k].mean(axis=0)
+
+    return centroids
 
 
 def ternary_to_cartesian(
-    clay: np.ndarray, sand: np.ndarray, silt: np.ndarray, ternary_sum: float = 100.0
+    clay: np.ndarray,
+    sand: Optional[np.ndarray] = None,
+    silt: Optional[np.ndarray] = None,
+    ternary_sum: float = 100.0,
+    normalize: bool = True,
 ) -> np.ndarray:
     """
     Convert ternary coordinates (clay, sand, silt) to 2D Cartesian (x, y).
@@ -47,36 +115,56 @@ def ternary_to_cartesian(
     Parameters
     ----------
     clay : np.ndarray
-        Clay percentages.
-    sand : np.ndarray
+        Clay percentages, or an (N, 3) array of packed (clay, sand, silt)
+        rows when ``sand`` and ``silt`` are omitted.
+    sand : np.ndarray, optional
         Sand percentages.
-    silt : np.ndarray
+    silt : np.ndarray, optional
         Silt percentages.
     ternary_sum : float, optional
         The sum of the ternary components (default 100.0).
+    normalize : bool, optional
+        Rescale each point so its components sum to ``ternary_sum`` (default
+        True). Pass False when the inputs are known to sum to ``ternary_sum``
+        already to skip the extra passes over the data.
 
     Returns
     -------
     np.ndarray
         Array of shape (N, 2) containing Cartesian (x, y) coordinates.
     """
-    clay = np.asarray(clay, dtype=float)
-    sand = np.asarray(sand, dtype=float)
-    silt = np.asarray(silt, dtype=float)
-
-    # Normalize to sum to ternary_sum to be safe
-    total = clay + sand + silt
-    total[total == 0] = ternary_sum
-    clay = clay * ternary_sum / total
-    sand = sand * ternary_sum / total
-    silt = silt * ternary_sum / total
+    if sand is None or silt is None:
+        clay, sand, silt = np.asarray(clay).T
+
+    clay = np.asarray(clay)
+    sand = np.asarray(sand)
+    silt = np.asarray(silt)
+    # float32 input stays float32; anything else is computed in float64.
+    dtype = np.result_type(clay.dtype, sand.dtype, silt.dtype, np.float32)
+    sand = sand.astype(dtype, copy=False)
+    silt = silt.astype(dtype, copy=False)
+    half = dtype.type(0.5)
+    height = dtype.type(math.sqrt(3) / 2.0)
+
+    if normalize:
+        # Normalize to sum to ternary_sum to be safe. Clay itself does not
+        # enter x or y, so only its contribution to the total is needed.
+        total = clay.astype(dtype, copy=False) + sand + silt
+        total[total == 0] = ternary_sum
+        sand = sand * ternary_sum / total
+        silt = silt * ternary_sum / total
 
     # Place triangle with one vertex at (0, 0), base horizontal
     # Many ternary implementations use:
     # x = 0.5 * (2*sand + silt) / ternary_sum
     # y = (np.sqrt(3)/2) * silt / ternary_sum
     # but we’ll keep units ~percent and let plotting handle scaling.
-    x = sand + 0.5 * silt
-    y = (np.sqrt(3) / 2.0) * silt
-
-    return np.stack([x, y], axis=-1)
+    # x and y are written straight into the result instead of stacked.
+    out = np.empty(np.broadcast_shapes(sand.shape, silt.shape) + (2,), dtype=dtype)
+    x = out[..., 0]
+    y = out[..., 1]
+    np.multiply(silt, half, out=x)
+    np.add(sand, x, out=x)
+    np.multiply(silt, height, out=y)
+
+    return out
@@ -0,0 +1,205 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from soiltextureplot import PolygonClassifier, get_texture_system
+from soiltextureplot import classifier as classifier_module
+from soiltextureplot.triangle import SoilTextureTriangle
+
+
+def test_classify_points_usda_interior() -> None:
+    classifier = PolygonClassifier.from_system(get_texture_system("USDA"))
+    labels = classifier.classify_points(
+        clay=np.array([15.0, 5.0, 30.0, 70.0]),
+        sand=np.array([65.0, 90.0, 30.0, 10.0]),
+        silt=np.array([20.0, 5.0, 40.0, 20.0]),
+    )
+    assert list(labels) == ["sandy loam", "sand", "clay loam", "clay"]
+
+
+def test_classify_points_hypres_interior() -> None:
+    classifier = PolygonClassifier.from_system(get_texture_system("HYPRES"))
+    labels = classifier.classify_points(
+        clay=np.array([5.0, 20.0, 10.0, 45.0, 80.0]),
+        sand=np.array([85.0, 40.0, 5.0, 30.0, 10.0]),
+        silt=np.array([10.0, 40.0, 85.0, 25.0, 10.0]),
+    )
+    assert list(labels) == ["coarse", "medium", "medium fine", "fine", "very fine"]
+
+
+def test_classify_points_returns_unknown_outside_polygons() -> None:
+    classifier = PolygonClassifier.from_system(get_texture_system("USDA"))
+    labels = classifier.classify_points(
+        clay=np.array([-50.0]), sand=np.array([75.0]), silt=np.array([75.0])
+    )
+    assert labels.dtype == object
+    assert list(labels) == ["Unknown"]
+
+
+# (clay, sand, silt) on the sides and corners of the triangle: clay = 0,
+# sand = 0, silt = 0, then the clay, sand and silt corners.
+EDGE_POINTS = np.array(
+    [
+        [0.0, 90.0, 10.0],
+        [0.0, 50.0, 50.0],
+        [0.0, 99.8, 0.2],
+        [20.0, 0.0, 80.0],
+        [40.0, 60.0, 0.0],
+        [100.0, 0.0, 0.0],
+        [0.0, 100.0, 0.0],
+        [0.0, 0.0, 100.0],
+    ]
+)
+
+
+def test_classify_points_usda_triangle_edges() -> None:
+    classifier = PolygonClassifier.from_system(get_texture_system("USDA"))
+    assert list(classifier.classify_points(EDGE_POINTS)) == [
+        "sand",
+        "silt loam",
+        "sand",
+        "silt loam",
+        "sandy clay",
+        "clay",
+        "sand",
+        "silt",
+    ]
+
+
+def test_classify_points_hypres_triangle_edges() -> None:
+    classifier = PolygonClassifier.from_system(get_texture_system("HYPRES"))
+    assert list(classifier.classify_points(EDGE_POINTS)) == [
+        "coarse",
+        "medium",
+        "coarse",
+        "medium fine",
+        "fine",
+        "very fine",
+        "coarse",
+        "medium fine",
+    ]
+
+
+def _usda_class_rules(clay: np.ndarray, sand: np.ndarray, silt: np.ndarray) -> list:
+    """Published USDA class definitions, as used by the NRCS texture calculator."""
+    rules = {
+        "sand": silt + 1.5 * clay < 15,
+        "loamy sand": (silt + 1.5 * clay >= 15) & (silt + 2 * clay < 30),
+        "sandy loam": (
+            (clay >= 7) & (clay < 20) & (sand > 52) & (silt + 2 * clay >= 30)
+        )
+        | ((clay < 7) & (silt < 50) & (silt + 2 * clay >= 30)),
+        "loam": (clay >= 7) & (clay < 27) & (silt >= 28) & (silt < 50) & (sand <= 52),
+        "silt loam": ((silt >= 50) & (clay >= 12) & (clay < 27))
+        | ((silt >= 50) & (silt < 80) & (clay < 12)),
+        "silt": (silt >= 80) & (clay < 12),
+        "sandy clay loam": (clay >= 20) & (clay < 35) & (silt < 28) & (sand > 45),
+        "clay loam": (clay >= 27) & (clay < 40) & (sand > 20) & (sand <= 45),
+        "silty clay loam": (clay >= 27) & (clay < 40) & (sand <= 20),
+        "sandy clay": (clay >= 35) & (sand > 45),
+        "silty clay": (clay >= 40) & (silt >= 40),
+        "clay": (clay >= 40) & (sand <= 45) & (silt < 40),
+    }
+    labels = np.full(clay.shape, "Unknown", dtype=object)
+    for name, match in rules.items():
+        labels[match] = name
+    return list(labels)
+
+
+def test_classify_points_usda_follows_class_rules_on_boundaries() -> None:
+    # Every integer sample, so every class boundary line and corner is hit.
+    steps = np.arange(101.0)
+    clay, sand = (a.ravel() for a in np.meshgrid(steps, steps))
+    keep = clay + sand <= 100.0
+    clay, sand = clay[keep], sand[keep]
+    silt = 100.0 - clay - sand
+
+    classifier = PolygonClassifier.from_system(get_texture_system("USDA"))
+    labels = classifier.classify_points(clay, sand, silt)
+    assert list(labels) == _usda_class_rules(clay, sand, silt)
+
+
+def test_classify_points_all_zero_is_unknown() -> None:
+    classifier = PolygonClassifier.from_system(get_texture_system("USDA"))
+    labels = classifier.classify_points(np.zeros((2, 3)))
+    assert list(labels) == ["Unknown", "Unknown"]
+
+
+def test_classify_points_accepts_packed_array() -> None:
+    classifier = PolygonClassifier.from_system(get_texture_system("USDA"))
+    packed = np.array([[15.0, 65.0, 20.0], [70.0, 10.0, 20.0]], dtype=np.float32)
+    labels = classifier.classify_points(packed)
+    assert list(labels) == list(
+        classifier.classify_points(packed[:, 0], packed[:, 1], packed[:, 2])
+    )
+
+
+def test_classify_codes_index_class_names() -> None:
+    classifier = PolygonClassifier.from_system(get_texture_system("HYPRES"))
+    points = np.array([[15.0, 65.0, 20.0], [np.nan, 10.0, 20.0]], dtype=np.float32)
+    codes = classifier.classify_codes(points)
+    names = [classifier.class_names[code] for code in codes]
+    assert names == list(classifier.classify_points(points))
+    assert names[-1] == "Unknown"
+
+
+def test_from_system_is_cached_per_system() -> None:
+    usda = get_texture_system("USDA")
+    assert PolygonClassifier.from_system(usda) is PolygonClassifier.from_system(usda)
+    assert PolygonClassifier.from_system(usda) is not PolygonClassifier.from_system(
+        get_texture_system("HYPRES")
+    )
+
+
+def test_priority_does_not_change_labels() -> None:
+    usda = get_texture_system("USDA")
+    reordered = replace(usda, name="USDA-reversed", priority=usda.priority[::-1])
+    rng = np.random.default_rng(0)
+    points = rng.dirichlet(np.ones(3), size=2000) * 100.0
+
+    expected = PolygonClassifier.from_system(usda).classify_points(points)
+    classifier = PolygonClassifier.from_system(reordered)
+    assert classifier._class_order[0] == usda.priority[-1]
+    assert list(classifier.classify_points(points)) == list(expected)
+
+
+def test_triangles_share_the_cached_classifier() -> None:
+    first = SoilTextureTriangle(system_name="HYPRES")
+    second = SoilTextureTriangle(system_name="HYPRES")
+    assert first._classifier is second._classifier
+
+
+@pytest.mark.parametrize("system_name", ["USDA", "HYPRES"])
+def test_numba_kernel_matches_numpy_fallback(
+    system_name: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("numba")
+    assert classifier_module._HAVE_NUMBA
+    classifier = PolygonClassifier.from_system(get_texture_system(system_name))
+
+    # A 0.5 % grid over the whole triangle, sides and corners included, the
+    # same grid scaled off 100 %, and rows with missing or all-zero values.
+    steps = np.arange(0.0, 100.25, 0.5)
+    clay, sand = (a.ravel() for a in np.meshgrid(steps, steps))
+    keep = clay + sand <= 100.0
+    grid = np.column_stack([clay[keep], sand[keep], 100.0 - clay[keep] - sand[keep]])
+    points = np.vstack(
+        [grid, grid * 0.9, [[np.nan, 50.0, 50.0], [0.0, 0.0, 0.0]]]
+    ).astype(np.float32)
+
+    compiled = classifier.classify_points(points)
+    monkeypatch.setattr(classifier_module, "_HAVE_NUMBA", False)
+    fallback = classifier.classify_points(points)
+    assert list(compiled) == list(fallback)
+
+
+def test_classify_is_thread_safe() -> None:
+    classifier = PolygonClassifier.from_system(get_texture_system("USDA"))
+    points = np.random.default_rng(0).dirichlet([1.0, 1.0, 1.0], 10_000) * 100.0
+    expected = list(classifier.classify_points(points))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(classifier.classify_points, [points] * 8))
+    assert all(list(labels) == expected for labels in results)
@@ -45,6 +45,21 @@ def test_classify_writes_texture_class(tmp_path: Path) -> None:
     assert content.count("\n") >= 4
 
 
+def test_classify_keeps_input_values(tmp_path: Path) -> None:
+    input_csv = _write_sample_csv(tmp_path / "in.csv")
+    precise_csv = tmp_path / "precise.csv"
+    precise_csv.write_text(
+        "sample_id,sand,silt,clay\nS1,65.123456789,20.1,14.776543211\n",
+        encoding="utf-8",
+    )
+    result = runner.invoke(app, ["classify", str(input_csv)])
+    assert result.exit_code == 0
+    assert "S1,65,20,15,1.35," in result.stdout
+    result = runner.invoke(app, ["classify", str(precise_csv)])
+    assert result.exit_code == 0
+    assert "S1,65.123456789,20.1,14.776543211," in result.stdout
+
+
 def test_classify_stdout(tmp_path: Path) -> None:
     input_csv = _write_sample_csv(tmp_path / "in.csv")
     result = runner.invoke(app, ["classify", str(input_csv)])
@@ -64,6 +79,21 @@ def test_plot_writes_image(tmp_path: Path) -> None:
     assert output_png.stat().st_size > 0
 
 
+def test_plot_max_labels(tmp_path: Path) -> None:
+    input_csv = _write_sample_csv(tmp_path / "in.csv")
+    output_png = tmp_path / "triangle.png"
+    result = runner.invoke(
+        app, ["plot", str(input_csv), "-o", str(output_png), "--max-labels", "1"]
+    )
+    assert result.exit_code == 0
+    assert output_png.is_file()
+
+    result = runner.invoke(
+        app, ["plot", str(input_csv), "-o", str(output_png), "--max-labels", "-1"]
+    )
+    assert result.exit_code != 0
+
+
 def test_run_writes_csv_and_figure(tmp_path: Path) -> None:
     input_csv = _write_sample_csv(tmp_path / "in.csv")
     output_csv = tmp_path / "classified.csv"
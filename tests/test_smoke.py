@@ -3,8 +3,11 @@ import matplotlib
 matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+import pytest
 from matplotlib.axes import Axes
+from matplotlib.colors import same_color
 from matplotlib.figure import Figure
 
 from soiltextureplot import (
@@ -51,6 +54,14 @@ def test_classification_smoke() -> None:
     assert out["texture_class"].notna().all()
 
 
+def test_classify_sees_in_place_edits() -> None:
+    tri = SoilTextureTriangle(system_name="USDA").load_dataframe(_sample_df())
+    assert tri.classify()["texture_class"][0] == "sandy loam"
+    assert tri.df is not None
+    tri.df.loc[0, ["clay", "sand", "silt"]] = [70.0, 10.0, 20.0]
+    assert tri.classify()["texture_class"][0] == "clay"
+
+
 def test_plot_smoke() -> None:
     df = _sample_df()
     system = get_texture_system("USDA")
@@ -58,3 +69,92 @@ def test_plot_smoke() -> None:
     assert isinstance(fig, Figure)
     assert isinstance(ax, Axes)
     plt.close(fig)
+
+
+def test_plot_draws_single_colour_markers_as_one_collection() -> None:
+    df = _sample_df().assign(BD=[1.35, 1.42, 1.20])
+    system = get_texture_system("USDA")
+    fig, ax = plot_triangle_with_points(
+        df=df, system=system, size_by="BD", color_points="black"
+    )
+    assert not ax.lines
+    markers = ax.collections[-1]
+    assert len(markers.get_offsets()) == 3
+    plt.close(fig)
+
+
+def test_plot_default_point_colour_follows_class_fills() -> None:
+    for name, colour in [("USDA", "C2"), ("HYPRES", "C5")]:
+        fig, ax = plot_triangle_with_points(
+            df=_sample_df(), system=get_texture_system(name)
+        )
+        markers = ax.collections[-1]
+        assert same_color(markers.get_facecolor()[0][:3], colour)
+        plt.close(fig)
+
+
+def test_plot_copies_cached_background_per_style() -> None:
+    from soiltextureplot.plotting import _background_bytes
+
+    df = _sample_df()
+    system = get_texture_system("USDA")
+    fig1, ax1 = plot_triangle_with_points(df=df, system=system)
+    hits = _background_bytes.cache_info().hits
+    fig2, ax2 = plot_triangle_with_points(df=df, system=system)
+    assert _background_bytes.cache_info().hits == hits + 1
+    assert fig1 is not fig2
+    assert len(ax1.collections) == len(ax2.collections)
+
+    with plt.rc_context({"axes.facecolor": "yellow"}):
+        fig3, ax3 = plot_triangle_with_points(df=df, system=system)
+    assert same_color(ax3.get_facecolor(), "yellow")
+    assert not same_color(ax1.get_facecolor(), "yellow")
+    for fig in (fig1, fig2, fig3):
+        plt.close(fig)
+
+
+def test_custom_systems_with_array_vertices_key_caches() -> None:
+    def build() -> TextureSystem:
+        # Same name as a built-in system and ndarray vertices, built twice.
+        return TextureSystem(
+            name="USDA",
+            polygons={
+                "low clay": np.array(
+                    [
+                        [0.0, 100.0, 0.0],
+                        [50.0, 50.0, 0.0],
+                        [50.0, 0.0, 50.0],
+                        [0.0, 0.0, 100.0],
+                    ]
+                ),
+                "high clay": np.array(
+                    [[50.0, 50.0, 0.0], [100.0, 0.0, 0.0], [50.0, 0.0, 50.0]]
+                ),
+            },
+            meta={"description": "Two classes"},
+        )
+
+    df = _sample_df()
+    for system in (build(), build(), get_texture_system("USDA")):
+        classifier = PolygonClassifier.from_system(system)
+        assert classifier.system is system
+        fig, _ = plot_triangle_with_points(df=df, system=system)
+        plt.close(fig)
+    labels = PolygonClassifier.from_system(build()).classify_points(
+        df[["clay", "sand", "silt"]].to_numpy()
+    )
+    assert list(labels) == ["low clay"] * 3
+
+
+def test_plot_thins_labels_on_large_datasets() -> None:
+    df = pd.concat([_sample_df()] * 100, ignore_index=True)
+    system = get_texture_system("USDA")
+    fig, ax = plot_triangle_with_points(
+        df=df, system=system, show_labels=True, max_labels=2
+    )
+    sample_labels = [t for t in ax.texts if t.get_text() in {"S1", "S2", "S3"}]
+    assert 1 <= len(sample_labels) <= 2
+    plt.close(fig)
+
+    with pytest.raises(ValueError, match="max_labels"):
+        plot_triangle_with_points(df=df, system=system, max_labels=-1)